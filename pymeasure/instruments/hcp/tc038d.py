@@ -33,16 +33,28 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
-def CRC16(data):
-    """Calculate the CRC16 checksum for the data byte array."""
-    CRC = 0xFFFF
-    for octet in data:
-        CRC ^= octet
+def _CRC16_table():
+    """Return the CRC16 value of each possible octet, shifted through all 8 bits."""
+    table = []
+    for octet in range(256):
+        CRC = octet
         for j in range(8):
             lsb = CRC & 0x1  # least significant bit
             CRC = CRC >> 1
             if lsb:
                 CRC ^= 0xA001
+        table.append(CRC)
+    return tuple(table)
+
+
+_CRC16_TABLE = _CRC16_table()
+
+
+def CRC16(data):
+    """Calculate the CRC16 checksum for the data byte array."""
+    CRC = 0xFFFF
+    for octet in data:
+        CRC = (CRC >> 8) ^ _CRC16_TABLE[(CRC ^ octet) & 0xFF]
     return [CRC & 0xFF, CRC >> 8]
 
 
@@ -574,8 +574,8 @@ class ErrorCode:
         :type code: str, int
         """
         if not (isinstance(code, int) or isinstance(code, str)):
-            print(type(code))
-            raise TypeError("Initialziation type for code must be integer or string")
+            raise TypeError("Initialziation type for code must be integer or string, "
+                            f"not {type(code).__name__}")
 
         try:
             self.code = int(code)
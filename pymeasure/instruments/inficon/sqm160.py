@@ -25,6 +25,23 @@
 from pymeasure.instruments import Channel, Instrument
 
 
+def _crc_table():
+    """Return the CRC value of each possible byte, shifted through all 8 bits."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for i in range(8):
+            tmpcrc = crc
+            crc = crc >> 1
+            if tmpcrc & 1 == 1:
+                crc ^= 0x2001
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _crc_table()
+
+
 def calculate_checksum(msg):
     """calculate a two byte Cyclic Redundancy Check based on 14 bits
 
@@ -38,15 +55,9 @@ def calculate_checksum(msg):
         return chr(0) + chr(0)
     # initialize CRC
     crc = 0x3fff
-    # loop over characters in message
+    # loop over characters in message, processing 8 bits at a time
     for char in msg:
-        crc ^= char
-        for i in range(8):
-            tmpcrc = crc
-            crc = crc >> 1
-            if tmpcrc & 1 == 1:
-                crc ^= 0x2001
-        crc &= 0x3fff
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ char) & 0xff]
     # separate 14 significant bits in two byte checksum
     return bytes(((crc & 0x7f) + 34, ((crc >> 7) & 0x7f) + 34))
 
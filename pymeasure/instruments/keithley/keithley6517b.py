@@ -35,6 +35,9 @@ from .buffer import KeithleyBuffer
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Reading with a four letter unit suffix, e.g. "+1.234E-09NADC"
+_re_reading = re.compile(r'([+\-0-9E.]+)[A-Z]{4}')
+
 
 class Keithley6517B(KeithleyBuffer, Instrument):
     """ Represents the Keithley 6517B ElectroMeter and provides a
@@ -70,7 +73,7 @@ class Keithley6517B(KeithleyBuffer, Instrument):
     def extract_value(result):
         """ extracts the physical value from a result object returned
             by the instrument """
-        m = re.fullmatch(r'([+\-0-9E.]+)[A-Z]{4}', result[0])
+        m = _re_reading.fullmatch(result[0])
         if m:
             return float(m.group(1))
         return None
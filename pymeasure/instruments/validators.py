@@ -35,11 +35,12 @@ def strict_range(value, values):
     :param values: A range of values (range, list, etc.)
     :raises: ValueError if the value is out of the range
     """
-    if min(values) <= value <= max(values):
+    low, high = min(values), max(values)
+    if low <= value <= high:
         return value
     else:
         raise ValueError('Value of {:g} is not in range [{:g},{:g}]'.format(
-            value, min(values), max(values)
+            value, low, high
         ))
 
 
@@ -89,12 +90,13 @@ def truncated_range(value, values):
     :param value: A value to test
     :param values: A set of values that are valid
     """
-    if min(values) <= value <= max(values):
+    low, high = min(values), max(values)
+    if low <= value <= high:
         return value
-    elif value > max(values):
-        return max(values)
+    elif value > high:
+        return high
     else:
-        return min(values)
+        return low
 
 
 def modular_range(value, values):
@@ -131,8 +133,7 @@ def truncated_discrete_set(value, values):
     :param values: A set of values that are valid
     """
     # Force the values to be sorted
-    values = list(values)
-    values.sort()
+    values = sorted(values)
     for v in values:
         if value <= v:
             return v
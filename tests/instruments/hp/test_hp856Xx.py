@@ -245,6 +245,11 @@ class TestHP856Xx:
         ) as instr:
             assert instr.errors == [ErrorCode(112), ErrorCode(101), ErrorCode(111)]
 
+    def test_error_code_invalid_type(self, capsys):
+        with pytest.raises(TypeError, match="not float"):
+            ErrorCode(1.5)
+        assert capsys.readouterr().out == ""
+
     def test_elapsed_time(self):
         with expected_protocol(
                 HP856Xx,